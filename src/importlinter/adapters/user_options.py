@@ -3,11 +3,6 @@ from typing import Any, Dict, Optional, List
 import abc
 import sys
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
 from importlinter.application import file_finding
 from importlinter.application.app_config import settings
 from importlinter.application.ports import user_options as ports
@@ -87,6 +82,13 @@ class TomlFileUserOptionReader(AbstractUserOptionReader):
     potential_config_filenames = ["pyproject.toml"]
 
     def _read_config_filename(self, config_filename: str) -> Optional[UserOptions]:
+        # Import the TOML parser here rather than at module level, as it is relatively slow to
+        # import and isn't needed by projects that keep their configuration in an INI file.
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
         file_contents = settings.FILE_SYSTEM.read(config_filename)
         data = tomllib.loads(file_contents)
 
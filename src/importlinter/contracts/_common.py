@@ -8,10 +8,10 @@ without warning.
 from __future__ import annotations
 
 import itertools
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 import grimp
-from grimp import ImportGraph
+from grimp import DetailedImport, ImportGraph
 from typing_extensions import TypedDict
 
 from importlinter.application import output
@@ -59,13 +59,11 @@ def find_segments(
         if len(chain) == 2:
             raise ValueError("Direct chain found - these should have been removed.")
         segment: List[Link] = []
-        for importer_in_chain, imported_in_chain in [
-            (chain[i], chain[i + 1]) for i in range(len(chain) - 1)
-        ]:
+        for importer_in_chain, imported_in_chain in pairwise(chain):
             import_details = reference_graph.get_import_details(
                 importer=importer_in_chain, imported=imported_in_chain
             )
-            line_numbers = tuple(sorted(set(j["line_number"] for j in import_details)))
+            line_numbers = _to_sorted_line_numbers(import_details)
             segment.append(
                 {
                     "importer": importer_in_chain,
@@ -84,39 +82,33 @@ def segments_to_collapsed_chains(
     for segment in segments:
         head_imports: List[Link] = []
         imported_module = segment[0]["imported"]
-        candidate_modules = sorted(graph.find_modules_that_directly_import(imported_module))
-        for module in [
-            m
-            for m in candidate_modules
-            if Module(m) == importer or Module(m).is_descendant_of(importer)
-        ]:
+        for module in _sorted_modules_in_package(
+            graph.find_modules_that_directly_import(imported_module), importer
+        ):
             import_details_list = graph.get_import_details(
                 importer=module, imported=imported_module
             )
-            line_numbers = tuple(sorted(set(j["line_number"] for j in import_details_list)))
+            line_numbers = _to_sorted_line_numbers(import_details_list)
             head_imports.append(
                 {"importer": module, "imported": imported_module, "line_numbers": line_numbers}
             )
 
         tail_imports: List[Link] = []
         importer_module = segment[-1]["importer"]
-        candidate_modules = sorted(graph.find_modules_directly_imported_by(importer_module))
-        for module in [
-            m
-            for m in candidate_modules
-            if Module(m) == imported or Module(m).is_descendant_of(imported)
-        ]:
+        for module in _sorted_modules_in_package(
+            graph.find_modules_directly_imported_by(importer_module), imported
+        ):
             import_details_list = graph.get_import_details(
                 importer=importer_module, imported=module
             )
-            line_numbers = tuple(sorted(set(j["line_number"] for j in import_details_list)))
+            line_numbers = _to_sorted_line_numbers(import_details_list)
             tail_imports.append(
                 {"importer": importer_module, "imported": module, "line_numbers": line_numbers}
             )
 
         collapsed_chains.append(
             {
-                "chain": [head_imports[0]] + segment[1:-1] + [tail_imports[0]],
+                "chain": [head_imports[0], *segment[1:-1], tail_imports[0]],
                 "extra_firsts": head_imports[1:],
                 "extra_lasts": tail_imports[1:],
             }
@@ -125,17 +117,36 @@ def segments_to_collapsed_chains(
     return collapsed_chains
 
 
+def _sorted_modules_in_package(module_names: Iterable[str], package: Module) -> List[str]:
+    """
+    Return, in order, the supplied module names that are the package or one of its descendants.
+
+    The names are filtered before sorting, as usually only a few of them will be in the package.
+    """
+    descendant_prefix = f"{package.name}."
+    return sorted(
+        name for name in module_names if name == package.name or name.startswith(descendant_prefix)
+    )
+
+
 def _pop_shortest_chains(graph: ImportGraph, importer: str, imported: str):
     chain: Union[Optional[Tuple[str, ...]], bool] = True
     while chain:
         chain = graph.find_shortest_chain(importer, imported)
         if chain:
             # Remove chain of imports from graph.
-            for index in range(len(chain) - 1):
-                graph.remove_import(importer=chain[index], imported=chain[index + 1])
+            for importer_in_chain, imported_in_chain in pairwise(chain):
+                graph.remove_import(importer=importer_in_chain, imported=imported_in_chain)
             yield chain
 
 
+def _to_sorted_line_numbers(import_details: List[DetailedImport]) -> Tuple[int, ...]:
+    """
+    Return the unique line numbers of the supplied imports, in order.
+    """
+    return tuple(sorted({details["line_number"] for details in import_details}))
+
+
 def format_line_numbers(line_numbers: Sequence[Optional[int]]) -> str:
     """
     Return a human-readable string of the supplied line numbers.
@@ -183,13 +194,26 @@ def _render_direct_import(
             output.print_error(f"  {import_string}", bold=False)
 
 
-def build_detailed_chain_from_route(route: grimp.Route, graph: grimp.ImportGraph) -> DetailedChain:
+def build_detailed_chain_from_route(
+    route: grimp.Route,
+    graph: grimp.ImportGraph,
+    line_numbers_cache: dict[tuple[str, str], tuple[int | None, ...]] | None = None,
+) -> DetailedChain:
+    """
+    Build a DetailedChain from a route returned by Grimp.
+
+    Routes frequently share imports, so callers building several chains from the same graph
+    may pass in a dictionary to cache the line numbers of each import between calls.
+    The graph must not be mutated while the cache is in use.
+    """
     ordered_heads = sorted(route.heads)
     extra_firsts: list[Link] = [
         {
             "importer": head,
             "imported": route.middle[0],
-            "line_numbers": get_line_numbers(importer=head, imported=route.middle[0], graph=graph),
+            "line_numbers": get_line_numbers(
+                importer=head, imported=route.middle[0], graph=graph, cache=line_numbers_cache
+            ),
         }
         for head in ordered_heads[1:]
     ]
@@ -199,7 +223,7 @@ def build_detailed_chain_from_route(route: grimp.Route, graph: grimp.ImportGraph
             "imported": tail,
             "importer": route.middle[-1],
             "line_numbers": get_line_numbers(
-                imported=tail, importer=route.middle[-1], graph=graph
+                imported=tail, importer=route.middle[-1], graph=graph, cache=line_numbers_cache
             ),
         }
         for tail in ordered_tails[1:]
@@ -209,7 +233,9 @@ def build_detailed_chain_from_route(route: grimp.Route, graph: grimp.ImportGraph
         {
             "importer": importer,
             "imported": imported,
-            "line_numbers": get_line_numbers(importer=importer, imported=imported, graph=graph),
+            "line_numbers": get_line_numbers(
+                importer=importer, imported=imported, graph=graph, cache=line_numbers_cache
+            ),
         }
         for importer, imported in pairwise(chain_as_strings)
     ]
@@ -221,10 +247,35 @@ def build_detailed_chain_from_route(route: grimp.Route, graph: grimp.ImportGraph
 
 
 def get_line_numbers(
-    importer: str, imported: str, graph: grimp.ImportGraph
+    importer: str,
+    imported: str,
+    graph: grimp.ImportGraph,
+    cache: dict[tuple[str, str], tuple[int | None, ...]] | None = None,
+    mark_unknown: bool = True,
 ) -> tuple[int | None, ...]:
+    """
+    Return the line numbers of the imports from the importer to the imported module.
+
+    If the graph has no details of the import (e.g. it was built manually), the line numbers are
+    unknown: (None,) is returned, or an empty tuple if mark_unknown is False.
+
+    Callers looking up many imports in the same graph may pass in a dictionary to cache the
+    results between calls. The graph must not be mutated while the cache is in use.
+    """
+    if cache is not None:
+        try:
+            return cache[(importer, imported)]
+        except KeyError:
+            pass
+
     details = graph.get_import_details(importer=importer, imported=imported)
-    line_numbers = tuple(i["line_number"] for i in details) if details else (None,)
+    if details or not mark_unknown:
+        line_numbers: tuple[int | None, ...] = tuple(i["line_number"] for i in details)
+    else:
+        line_numbers = (None,)
+
+    if cache is not None:
+        cache[(importer, imported)] = line_numbers
     return line_numbers
 
 
@@ -9,7 +9,7 @@ from importlinter.domain.contract import Contract, ContractCheck
 from importlinter.domain.imports import Module
 from grimp import ImportGraph
 
-from ._common import format_line_numbers
+from ._common import format_line_numbers, get_line_numbers, pairwise
 
 
 class ForbiddenContract(Contract):
@@ -47,15 +47,31 @@ class ForbiddenContract(Contract):
             unmatched_alerting=self.unmatched_ignore_imports_alerting,  # type: ignore
         )
 
-        self._check_all_modules_exist_in_graph(graph)
+        # Look up the modules once, as some graph implementations build a new set on each access.
+        modules = graph.modules
+        self._check_all_modules_exist_in_graph(modules)
         self._check_external_forbidden_modules()
 
         # We only need to check for illegal imports for forbidden modules that are in the graph.
         forbidden_modules_in_graph = [
-            m for m in self.forbidden_modules if m.name in graph.modules  # type: ignore
+            m for m in self.forbidden_modules if m.name in modules  # type: ignore
         ]
+        allow_indirect_imports = str(self.allow_indirect_imports).lower() == "true"
+        # Searching for chains is expensive. When indirect imports are forbidden, we only search
+        # from a source module to forbidden packages that it can reach (see below).
+        modules_by_forbidden_module: dict[Module, set[str]] = {}
+        if not allow_indirect_imports:
+            modules_by_forbidden_module = {
+                m: self._get_modules_in_package(m, graph) for m in forbidden_modules_in_graph
+            }
+        # Chains often share imports, so only look up the line numbers for each import once.
+        line_numbers_cache: dict[tuple[str, str], tuple[int | None, ...]] = {}
 
         for source_module in self.source_modules:  # type: ignore
+            # Forbidden modules outside this set cannot be imported by the source module.
+            reachable_modules: set[str] | None = None
+            if modules_by_forbidden_module:
+                reachable_modules = self._find_reachable_modules(source_module, graph)
             for forbidden_module in forbidden_modules_in_graph:
                 output.verbose_print(
                     verbose,
@@ -69,7 +85,7 @@ class ForbiddenContract(Contract):
                         "chains": [],
                     }
 
-                    if str(self.allow_indirect_imports).lower() == "true":
+                    if allow_indirect_imports:
                         chains = {
                             cast(
                                 Tuple[str, ...],
@@ -79,6 +95,10 @@ class ForbiddenContract(Contract):
                                 importer=source_module.name, imported=forbidden_module.name
                             )
                         }
+                    elif reachable_modules is not None and reachable_modules.isdisjoint(
+                        modules_by_forbidden_module[forbidden_module]
+                    ):
+                        chains = set()
                     else:
                         chains = graph.find_shortest_chains(
                             importer=source_module.name, imported=forbidden_module.name
@@ -87,13 +107,14 @@ class ForbiddenContract(Contract):
                         is_kept = False
                         for chain in sorted(chains):
                             chain_data = []
-                            for importer, imported in [
-                                (chain[i], chain[i + 1]) for i in range(len(chain) - 1)
-                            ]:
-                                import_details = graph.get_import_details(
-                                    importer=importer, imported=imported
+                            for importer, imported in pairwise(chain):
+                                line_numbers = get_line_numbers(
+                                    importer=importer,
+                                    imported=imported,
+                                    graph=graph,
+                                    cache=line_numbers_cache,
+                                    mark_unknown=False,
                                 )
-                                line_numbers = tuple(j["line_number"] for j in import_details)
                                 chain_data.append(
                                     {
                                         "importer": importer,
@@ -139,11 +160,33 @@ class ForbiddenContract(Contract):
 
             output.new_line()
 
-    def _check_all_modules_exist_in_graph(self, graph: ImportGraph) -> None:
+    def _check_all_modules_exist_in_graph(self, modules: set[str]) -> None:
         for module in self.source_modules:  # type: ignore
-            if module.name not in graph.modules:
+            if module.name not in modules:
                 raise ValueError(f"Module '{module.name}' does not exist.")
 
+    def _get_modules_in_package(self, module: Module, graph: ImportGraph) -> set[str]:
+        if graph.is_module_squashed(module.name):
+            return {module.name}
+        return {module.name} | graph.find_descendants(module.name)
+
+    def _find_reachable_modules(self, module: Module, graph: ImportGraph) -> set[str]:
+        """
+        Return the names of all the modules that the supplied module (or any of its descendants)
+        imports, directly or indirectly.
+
+        The modules in the supplied package are included in the returned set too.
+        """
+        reachable_modules = self._get_modules_in_package(module, graph)
+        modules_to_visit = list(reachable_modules)
+        while modules_to_visit:
+            importer = modules_to_visit.pop()
+            for imported in graph.find_modules_directly_imported_by(importer):
+                if imported not in reachable_modules:
+                    reachable_modules.add(imported)
+                    modules_to_visit.append(imported)
+        return reachable_modules
+
     def _check_external_forbidden_modules(self) -> None:
         external_forbidden_modules = self._get_external_forbidden_modules()
         if external_forbidden_modules:
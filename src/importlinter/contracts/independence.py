@@ -12,7 +12,13 @@ from importlinter.domain import fields
 from importlinter.domain.contract import Contract, ContractCheck
 from importlinter.domain.imports import Module
 
-from ._common import DetailedChain, Link, build_detailed_chain_from_route, render_chain_data
+from ._common import (
+    DetailedChain,
+    Link,
+    build_detailed_chain_from_route,
+    pairwise,
+    render_chain_data,
+)
 
 
 class _SubpackageChainData(TypedDict):
@@ -82,18 +88,24 @@ class IndependenceContract(Contract):
             output.new_line()
 
     def _check_all_modules_exist_in_graph(self, graph: ImportGraph) -> None:
+        modules = graph.modules
         for module in self.modules:  # type: ignore
-            if module.name not in graph.modules:
+            if module.name not in modules:
                 raise ValueError(f"Module '{module.name}' does not exist.")
 
     def _build_invalid_chains(
         self, dependencies: set[grimp.PackageDependency], graph: grimp.ImportGraph
     ) -> list[_SubpackageChainData]:
+        # Cache line numbers across routes, as different routes often share imports.
+        line_numbers_cache: dict[tuple[str, str], tuple[int | None, ...]] = {}
         return [
             {
                 "upstream_module": dependency.imported,
                 "downstream_module": dependency.importer,
-                "chains": [build_detailed_chain_from_route(c, graph) for c in dependency.routes],
+                "chains": [
+                    build_detailed_chain_from_route(c, graph, line_numbers_cache)
+                    for c in dependency.routes
+                ],
             }
             for dependency in dependencies
         ]
@@ -116,9 +128,7 @@ class IndependenceContract(Contract):
         if chains:
             for chain in chains:
                 chain_data: List[Link] = []
-                for importer, imported in [
-                    (chain[i], chain[i + 1]) for i in range(len(chain) - 1)
-                ]:
+                for importer, imported in pairwise(chain):
                     import_details = graph.get_import_details(importer=importer, imported=imported)
                     line_numbers = tuple(j["line_number"] for j in import_details)
                     chain_data.append(
@@ -22,12 +22,14 @@ class Layer:
 
 
 class LayerField(fields.Field):
+    _string_field = fields.StringField()
+
     def parse(self, raw_data: str | list) -> Layer | set[Layer]:
         layers = set()
-        raw_string = fields.StringField().parse(raw_data)
+        raw_string = self._string_field.parse(raw_data)
         raw_items = [item.strip() for item in raw_string.split("|")]
         for raw_item in raw_items:
-            if raw_item.startswith("(") and raw_item.endswith(")"):
+            if raw_item[:1] == "(" and raw_item[-1:] == ")":
                 layer_name = raw_item[1:-1]
                 is_optional = True
             else:
@@ -169,10 +171,16 @@ class LayersContract(Contract):
     def _validate_containers(self, graph: grimp.ImportGraph) -> None:
         root_package_names = self.session_options["root_packages"]
         root_packages = tuple(Module(name) for name in root_package_names)
+        # Look up the modules once, as some graph implementations build a new set on each access.
+        modules = graph.modules
+        required_layer_names = [
+            layer.name for layer in self.flattened_layers if not layer.is_optional
+        ]
 
         for container in self.containers:  # type: ignore
+            container_module = Module(container)
             if not any(
-                Module(container).is_in_package(root_package) for root_package in root_packages
+                container_module.is_in_package(root_package) for root_package in root_packages
             ):
                 if len(root_package_names) == 1:
                     root_package_name = root_package_names[0]
@@ -188,16 +196,14 @@ class LayersContract(Contract):
                         f"(The root packages are: {packages_string}.)"
                     )
                 raise ValueError(error_message)
-            self._check_all_layers_exist_for_container(container, graph)
+            self._check_all_layers_exist_for_container(container, required_layer_names, modules)
 
     def _check_all_layers_exist_for_container(
-        self, container: str, graph: grimp.ImportGraph
+        self, container: str, required_layer_names: Sequence[str], modules: set[str]
     ) -> None:
-        for layer in self.flattened_layers:
-            if layer.is_optional:
-                continue
-            layer_module_name = ".".join([container, layer.name])
-            if layer_module_name not in graph.modules:
+        for layer_name in required_layer_names:
+            layer_module_name = f"{container}.{layer_name}"
+            if layer_module_name not in modules:
                 raise ValueError(
                     f"Missing layer in container '{container}': "
                     f"module {layer_module_name} does not exist."
@@ -222,29 +228,28 @@ class LayersContract(Contract):
         return undeclared_modules
 
     def _check_all_containerless_layers_exist(self, graph: grimp.ImportGraph) -> None:
+        modules = graph.modules
         for layer in self.layers:  # type: ignore
             if layer.is_optional:
                 continue
-            if layer.name not in graph.modules:
+            if layer.name not in modules:
                 raise ValueError(
                     f"Missing layer '{layer.name}': module {layer.name} does not exist."
                 )
 
-    def _module_from_layer(self, layer: Layer, container: str | None = None) -> Module:
-        if container:
-            name = ".".join([container, layer.name])
-        else:
-            name = layer.name
-        return Module(name)
-
     def _build_invalid_chains(
         self, dependencies: set[grimp.PackageDependency], graph: grimp.ImportGraph
     ) -> list[_LayerChainData]:
+        # Cache line numbers across routes, as different routes often share imports.
+        line_numbers_cache: dict[tuple[str, str], tuple[int | None, ...]] = {}
         return [
             {
                 "imported": dependency.imported,
                 "importer": dependency.importer,
-                "routes": [build_detailed_chain_from_route(c, graph) for c in dependency.routes],
+                "routes": [
+                    build_detailed_chain_from_route(c, graph, line_numbers_cache)
+                    for c in dependency.routes
+                ],
             }
             for dependency in dependencies
         ]
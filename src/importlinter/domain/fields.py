@@ -152,8 +152,10 @@ class ModuleField(Field):
     A field for Modules.
     """
 
+    _string_field = StringField()
+
     def parse(self, raw_data: Union[str, List]) -> Module:
-        return Module(StringField().parse(raw_data))
+        return Module(self._string_field.parse(raw_data))
 
 
 class ImportExpressionField(Field):
@@ -168,8 +170,10 @@ class ImportExpressionField(Field):
         "mypackage.**.importer -> mypackage.bar.**"
     """
 
+    _string_field = StringField()
+
     def parse(self, raw_data: Union[str, List]) -> ImportExpression:
-        string = StringField().parse(raw_data)
+        string = self._string_field.parse(raw_data)
         importer, _, imported = string.partition(" -> ")
 
         if not (importer and imported):
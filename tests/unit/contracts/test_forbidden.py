@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from grimp.adaptors.graph import ImportGraph
 
@@ -125,6 +127,34 @@ class TestForbiddenContract:
 
         assert expected_metadata == contract_check.metadata
 
+    def test_only_searches_for_chains_to_reachable_forbidden_modules(self):
+        graph = self._build_graph()
+        contract = self._build_contract(forbidden_modules=("mypackage.purple",))
+
+        with patch.object(
+            graph, "find_shortest_chains", wraps=graph.find_shortest_chains
+        ) as find_shortest_chains:
+            contract_check = contract.check(graph=graph, verbose=False)
+
+        assert not contract_check.kept
+        find_shortest_chains.assert_called_once_with(
+            importer="mypackage.two", imported="mypackage.purple"
+        )
+
+    def test_allow_indirect_imports_does_not_look_up_reachable_modules(self):
+        graph = self._build_graph()
+        contract = self._build_contract(
+            forbidden_modules=("mypackage.green",), allow_indirect_imports="true"
+        )
+
+        with patch.object(
+            graph, "find_descendants", wraps=graph.find_descendants
+        ) as find_descendants:
+            contract_check = contract.check(graph=graph, verbose=False)
+
+        assert not contract_check.kept
+        find_descendants.assert_not_called()
+
     def test_is_invalid_when_forbidden_externals_but_graph_does_not_include_externals(self):
         graph = self._build_graph()
         contract = self._build_contract(forbidden_modules=("sqlalchemy", "requests"))